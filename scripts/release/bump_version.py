@@ -46,38 +46,100 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return args
 
 
+_VERSION_FIELD = b'version = "'
+# [project].version sits near the top of a pyproject.toml; only search beyond
+# this many bytes (via the regex fallback) when the field is not found here.
+_HEADER_WINDOW = 4096
+_PYPROJECT_VERSION_RE = re.compile(rb'version = "[^"]+"')
+
+
 def _bump_pyproject(path: str, version: str) -> None:
     """Read pyproject.toml, replace first version = "..." occurrence, write back."""
     if not os.path.isfile(path):
         msg = f"pyproject.toml not found: {path}"
         raise FileNotFoundError(msg)
 
-    content = open(path).read()
-    updated = re.sub(
-        r'version = "[^"]+"',
-        f'version = "{version}"',
-        content,
-        count=1,
-    )
-    with open(path, "w") as f:
+    with open(path, "rb") as f:
+        content = f.read()
+
+    new_value = version.encode()
+    start = content.find(_VERSION_FIELD, 0, _HEADER_WINDOW)
+    value_start = start + len(_VERSION_FIELD)
+    value_end = content.find(b'"', value_start) if start != -1 else -1
+    if value_end > value_start:
+        updated = content[:value_start] + new_value + content[value_end:]
+    else:
+        updated = _PYPROJECT_VERSION_RE.sub(
+            lambda _: _VERSION_FIELD + new_value + b'"', content, count=1
+        )
+    with open(path, "wb") as f:
         f.write(updated)
 
 
-def _bump_catalog(path: str, version: str) -> None:
-    """Read YAML catalog, set version key, write back preserving order."""
+# Top-level ``version:`` line: optional matching quotes around the value and an
+# optional trailing comment, both of which are preserved by the in-place patch.
+# The value must not open with a YAML indicator, so anchors, aliases, tags,
+# block scalars and flow collections are left to the YAML round-trip.
+_CATALOG_VERSION_RE = re.compile(
+    rb"""^version:[ \t]*(?P<quote>['"]?)(?P<value>[^'" \t\r\n#&*!|>{}\[\]@`][^'"\r\n#]*?)(?P=quote)[ \t]*(?:#[^\r\n]*)?\r?$""",
+    re.MULTILINE,
+)
+
+
+def _is_plain_yaml_string(value: str) -> bool:
+    """Return True if value, written unquoted, still loads as a YAML string."""
     import yaml
 
+    tag = yaml.resolver.Resolver().resolve(yaml.ScalarNode, value, (True, False))
+    return tag == "tag:yaml.org,2002:str"
+
+
+def _bump_catalog(path: str, version: str) -> None:
+    """Set the top-level version key of a YAML catalog, editing only that line.
+
+    Comments, ordering and formatting elsewhere are left untouched. Falls
+    back to a full YAML round-trip when the line cannot be patched safely.
+    """
     if not os.path.isfile(path):
         msg = f"Catalog file not found: {path}"
         raise FileNotFoundError(msg)
 
+    with open(path, "rb") as f:
+        content = f.read()
+
+    m = _CATALOG_VERSION_RE.search(content)
+    # An unquoted value must still resolve to a YAML string (e.g. not "1.2").
+    if m is not None and (m["quote"] or _is_plain_yaml_string(version)):
+        updated = (
+            content[: m.start("value")] + version.encode() + content[m.end("value") :]
+        )
+        with open(path, "wb") as f:
+            f.write(updated)
+        return
+
+    _bump_catalog_yaml(path, version)
+
+
+def _bump_catalog_yaml(path: str, version: str) -> None:
+    """Read YAML catalog, set version key, write back preserving order."""
+    import yaml
+
+    # Prefer the libyaml-backed C classes; fall back to pure Python without it.
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
     with open(path) as f:
-        catalog = yaml.safe_load(f)
+        catalog = yaml.load(f, Loader=SafeLoader)
 
     catalog["version"] = version
 
     with open(path, "w") as f:
-        yaml.dump(catalog, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            catalog, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+        )
 
 
 def main(argv: list[str] | None = None) -> None:
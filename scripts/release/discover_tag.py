@@ -1,7 +1,8 @@
 """Discover the highest semantic version tag for a given pattern (dev or rc).
 
 CLI interface:
-    python discover_tag.py --pattern PATTERN [--validate TAG] [--tag-list TAG1,TAG2,...]
+    python discover_tag.py --pattern PATTERN [--validate TAG]
+        [--tag-list TAG1,TAG2,... | --tag-file PATH]
 
 Patterns:
     dev  -> filters for dev pre-release tags (e.g. v1.1.23.dev1)
@@ -19,11 +20,19 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import operator
+import re
 import subprocess
 import sys
+from typing import TYPE_CHECKING
 
-from packaging.version import InvalidVersion, Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from packaging.version import Version
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -40,10 +49,16 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Explicit tag to validate against the tag list",
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
         "--tag-list",
         default=None,
-        help="Comma-separated list of tags (when omitted, uses git tag -l)",
+        help="Comma-separated list of tags (when omitted, uses git for-each-ref)",
+    )
+    source.add_argument(
+        "--tag-file",
+        default=None,
+        help="File with one tag per line (alternative to --tag-list)",
     )
     return parser.parse_args(argv)
 
@@ -77,8 +92,31 @@ def _output_error(error: str) -> None:
     _emit_and_exit({"error": error}, exit_code=2)
 
 
+# PEP 440 shape check, mirroring packaging's VERSION_PATTERN with an optional
+# "v" prefix. Tags that fail it (e.g. "latest", "v1.x") are rejected without
+# the cost of Version() raising InvalidVersion.
+_CANDIDATE_RE = re.compile(
+    r"""
+    v*
+    (?:\d+!)?                                               # epoch
+    \d+(?:\.\d+)*                                           # release
+    (?:[-_.]?(?:a|b|c|rc|alpha|beta|pre|preview)[-_.]?\d*)?  # pre-release
+    (?:-\d+|[-_.]?(?:post|rev|r)[-_.]?\d*)?                  # post-release
+    (?:[-_.]?dev[-_.]?\d*)?                                  # dev release
+    (?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?                      # local version
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_tag(tag: str) -> Version | None:
     """Parse a tag string into a packaging.Version, returning None for invalid tags."""
+    if not _CANDIDATE_RE.fullmatch(tag):
+        return None
+    # Imported on first use so --help and argument errors skip loading packaging.
+    from packaging.version import InvalidVersion, Version
+
     raw = tag.lstrip("v")
     try:
         return Version(raw)
@@ -94,15 +132,15 @@ def _is_rc_tag(version: Version) -> bool:
     return version.pre is not None and version.pre[0] == "rc"
 
 
-def _filter_by_pattern(tags: list[str], pattern: str) -> list[tuple[str, Version]]:
-    """Filter tags by pattern, returning (original_tag, parsed_version) pairs."""
+def _filter_by_pattern(
+    tags: Iterable[str], pattern: str
+) -> Iterator[tuple[str, Version]]:
+    """Lazily filter tags by pattern, yielding (original_tag, parsed_version) pairs."""
     matcher = _is_dev_tag if pattern == "dev" else _is_rc_tag
-    results = []
     for tag in tags:
         parsed = _parse_tag(tag)
         if parsed is not None and matcher(parsed):
-            results.append((tag, parsed))
-    return results
+            yield tag, parsed
 
 
 def _split_tag_list(tag_list_str: str) -> list[str]:
@@ -110,67 +148,102 @@ def _split_tag_list(tag_list_str: str) -> list[str]:
     return [tag.strip() for tag in tag_list_str.split(",") if tag.strip()]
 
 
+def _read_tag_file(path: str) -> list[str]:
+    """Read one tag per line from path, filtering blank lines."""
+    with open(path, encoding="utf-8") as f:
+        return [tag.strip() for tag in f.read().splitlines() if tag.strip()]
+
+
 def _stage_guidance(pattern: str) -> str:
     if pattern == "dev":
         return "No dev tags found. Run Stage 1 (Dev Release) first."
     return "No rc tags found. Run Stage 2 (RC Release) first."
 
 
-def _git_tags() -> list[str]:
-    """Fetch all tags from the current git repository via git tag -l."""
-    result = subprocess.run(
-        ["git", "tag", "-l"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
+# Git-side refspec globs per pattern, matched case-insensitively. for-each-ref
+# filters the refs itself, so only candidate tags cross the pipe. Each set
+# covers every spelling packaging normalizes to the pattern (rc also accepts
+# "c", "pre" and "preview"), so packaging.Version remains the authority.
+_TAG_REFSPECS = {
+    "dev": ("refs/tags/*dev*",),
+    "rc": ("refs/tags/*c*", "refs/tags/*pre*"),
+}
+
+
+def _git(*args: str) -> tuple[int, str]:
+    """Run git with args in the current directory; return (returncode, stdout)."""
+    result = subprocess.run(["git", *args], capture_output=True, text=True)
+    return result.returncode, result.stdout
+
+
+def _git_tags(*refspecs: str, ignore_case: bool = False) -> list[str]:
+    """Fetch tags matching any refspec (default: all tags) in one git call."""
+    args = ["for-each-ref", "--format=%(refname:lstrip=2)"]
+    if ignore_case:
+        args.append("--ignore-case")
+    returncode, stdout = _git(*args, *(refspecs or ("refs/tags",)))
+    if returncode != 0:
         return []
-    return [tag.strip() for tag in result.stdout.strip().splitlines() if tag.strip()]
+    return [tag.strip() for tag in stdout.strip().splitlines() if tag.strip()]
+
+
+def _git_tags_matching(pattern: str) -> list[str]:
+    """Fetch candidate tags for pattern; the refspec glob is only a pre-filter.
+
+    No git sort is requested: version:refname is not PEP 440 order (it
+    ranks v1.2.0rc1.dev2 above v1.2.0rc1) and versionsort.suffix can change
+    it, so discover() picks the winner with packaging.Version.
+    """
+    return _git_tags(*_TAG_REFSPECS[pattern], ignore_case=True)
 
 
 def _commits_behind(tag: str) -> int | None:
-    """Count commits between tag and HEAD via git rev-list --count TAG..HEAD."""
-    result = subprocess.run(
-        ["git", "rev-list", "--count", f"{tag}..HEAD"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
+    """Count first-parent commits between tag and HEAD.
+
+    --first-parent walks only the mainline, so a merged branch counts as one
+    commit and the walk stays short on large histories.
+    """
+    returncode, stdout = _git("rev-list", "--count", "--first-parent", f"{tag}..HEAD")
+    if returncode != 0:
         return None
     try:
-        return int(result.stdout.strip())
+        return int(stdout.strip())
     except ValueError:
         return None
 
 
 def discover(tags: list[str], pattern: str, use_git: bool = False) -> None:
-    """Discover the highest semantic version tag matching pattern."""
+    """Discover the highest semantic version tag matching pattern.
+
+    With use_git, commits_behind is also computed for the winning tag.
+    """
     matched = _filter_by_pattern(tags, pattern)
-    if not matched:
+    # One parse per tag; ties on Version fall back to the tag string.
+    best = max(matched, key=operator.itemgetter(1, 0), default=None)
+    if best is None:
         _output_not_found(_stage_guidance(pattern))
         return
 
-    _, highest_version = max(matched, key=lambda pair: pair[1])
-    tag_str = f"v{highest_version}"
+    # Report the tag exactly as it exists, rather than re-rendering the
+    # normalized Version, so rev-list below always names a real ref.
+    tag_str, _ = best
     staleness = _commits_behind(tag_str) if use_git else None
     _output_success(
         tag=tag_str,
-        version=str(highest_version),
+        version=tag_str.lstrip("v"),
         commits_behind=staleness,
     )
 
 
 def validate(tags: list[str], target: str) -> None:
-    """Validate that a specific tag exists in the tag list."""
+    """Validate that a specific tag exists in the tag list.
+
+    Only membership is checked; like discover(), the tag is reported exactly
+    as written, so no Version parsing is needed.
+    """
     if target in tags:
-        parsed = _parse_tag(target)
-        if parsed is not None:
-            _output_success(
-                tag=target,
-                version=str(parsed),
-                commits_behind=None,
-            )
-            return
+        _output_success(tag=target, version=target.lstrip("v"), commits_behind=None)
+        return
     _output_not_found(f"Tag '{target}' not found in tag list.")
 
 
@@ -182,8 +255,23 @@ def main(argv: list[str] | None = None) -> None:
         _output_error(f"Invalid pattern '{pattern}'. Must be 'dev' or 'rc'.")
         return
 
-    use_git = args.tag_list is None
-    tags = _git_tags() if use_git else _split_tag_list(args.tag_list)
+    use_git = args.tag_list is None and args.tag_file is None
+
+    if args.tag_file is not None:
+        try:
+            tags = _read_tag_file(args.tag_file)
+        except (OSError, UnicodeDecodeError) as exc:
+            # UnicodeDecodeError has no strerror; its str() names the bad byte.
+            reason = getattr(exc, "strerror", None) or exc
+            _output_error(f"Cannot read tag file '{args.tag_file}': {reason}")
+            return
+    elif args.tag_list is not None:
+        tags = _split_tag_list(args.tag_list)
+    elif args.validate is not None:
+        # Validation checks membership across all tags, whatever the pattern.
+        tags = _git_tags()
+    else:
+        tags = _git_tags_matching(pattern)
 
     if args.validate is not None:
         validate(tags, args.validate)
@@ -3,7 +3,7 @@
 CLI interface:
     python generate_changelog.py --stage dev|rc|stable --version VERSION
         [--source-tag SOURCE_TAG] [--repo GITHUB_REPOSITORY]
-        --output OUTPUT_PATH
+        [--prev-tag PREVIOUS_TAG] --output OUTPUT_PATH
 
 Stages:
     dev    -> Dev snapshot notes (no install section)
@@ -20,10 +20,17 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -51,6 +58,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default="",
         help="GitHub repository (e.g. nwave-ai/nwave-dev) for compare links",
     )
+    parser.add_argument(
+        "--prev-tag",
+        default=None,
+        help=(
+            "Previous tag to compare against (e.g. from discover_tag.py); "
+            "skips tag discovery. Pass '' to include the full history"
+        ),
+    )
     parser.add_argument(
         "--output",
         required=True,
@@ -64,6 +79,21 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 # ---------------------------------------------------------------------------
 
 
+def _git(*args: str) -> tuple[int, str]:
+    """Run git with args in the current directory; return (returncode, stdout)."""
+    result = subprocess.run(["git", *args], capture_output=True, text=True)
+    return result.returncode, result.stdout
+
+
+def _tag_exists(tag: str) -> bool:
+    """Check that tag resolves to a commit in the current repository."""
+    try:
+        returncode, _ = _git("rev-parse", "--verify", "--quiet", f"{tag}^{{commit}}")
+    except OSError:
+        return False
+    return returncode == 0
+
+
 def _find_previous_tag(stage: str, current_version: str) -> str:
     """Find previous tag for changelog comparison.
 
@@ -72,34 +102,37 @@ def _find_previous_tag(stage: str, current_version: str) -> str:
     """
     if stage == "dev":
         try:
-            result = subprocess.run(
-                ["git", "describe", "--tags", "--abbrev=0", "HEAD^"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
+            returncode, stdout = _git("describe", "--tags", "--abbrev=0", "HEAD^")
+            if returncode != 0:
                 return ""
-            return result.stdout.strip()
+            return stdout.strip()
         except OSError:
             return ""
 
-    try:
-        result = subprocess.run(
-            ["git", "tag", "--sort=-v:refname", "--merged", "HEAD"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return ""
-        all_tags = result.stdout.strip().splitlines()
-    except OSError:
-        return ""
-
+    args = [
+        "for-each-ref",
+        "--sort=-v:refname",
+        "--merged=HEAD",
+        "--format=%(refname:lstrip=2)",
+    ]
     if stage == "rc":
+        # The glob also admits shapes the regex rejects (v1.2.0rc1.dev2), so
+        # git must return every candidate rather than a fixed top-N.
+        args.append("refs/tags/v*rc*")
         tag_re = re.compile(r"^v\d+\.\d+\.\d+rc\d+$")
     else:
+        # No glob excludes pre-release suffixes, so stable scans every v* tag.
+        args.append("refs/tags/v*")
         tag_re = re.compile(r"^v\d+\.\d+\.\d+$")
 
+    try:
+        returncode, stdout = _git(*args)
+        if returncode != 0:
+            return ""
+        all_tags = stdout.strip().splitlines()
+    except OSError:
+        return ""
+
     current_tag = f"v{current_version}"
     return next(
         (
@@ -111,90 +144,111 @@ def _find_previous_tag(stage: str, current_version: str) -> str:
     )
 
 
-def _fetch_commits(prev_tag: str) -> str:
-    """Fetch commit log between prev_tag and HEAD (or all commits if no prev_tag)."""
-    record_end = "<<--EOR-->>"
-    fmt = f"%s%x00%b%x00%h{record_end}"
-    cmd = ["git", "log", "--no-merges", f"--pretty=format:{fmt}"]
+_READ_CHUNK = 64 * 1024
+
+
+def _fetch_commits(prev_tag: str) -> Iterator[tuple[bytes, bytes, bytes]]:
+    """Stream commits between prev_tag and HEAD (or all commits if no prev_tag).
+
+    ``git log -z`` emits ``subject NUL body NUL sha`` per commit with NUL
+    between commits, so no field can contain one and every field except the
+    final sha is NUL-terminated. Records are yielded as undecoded
+    (subject, body, sha) tuples while git is still writing, so the full log
+    is never held in memory.
+
+    Raises RuntimeError once the stream is exhausted if git log failed.
+    """
+    cmd = ["git", "log", "-z", "--no-merges", "--pretty=format:%s%x00%b%x00%h"]
     if prev_tag:
         cmd.insert(2, f"{prev_tag}..HEAD")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            return ""
-        return result.stdout
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
     except OSError:
-        return ""
+        return
+
+    # Leaving the Popen context closes stdout and reaps git, even when the
+    # consumer stops iterating early.
+    with proc:
+        read_chunk = functools.partial(proc.stdout.read1, _READ_CHUNK)
+        yield from _split_records(iter(read_chunk, b""))
+    if proc.returncode != 0:
+        raise RuntimeError(f"git log exited with status {proc.returncode}")
 
 
 # ---------------------------------------------------------------------------
 # Pure functions (no I/O, no subprocess)
 # ---------------------------------------------------------------------------
 
-_CONVENTIONAL_RE = re.compile(
-    r"^(?P<type>[a-z]+)(?:\((?P<scope>[^)]*)\))?(?P<bang>!)?:\s*(?P<desc>.+)$"
-)
+# Groups: type, scope, bang, desc. Numeric groups and ASCII-only classes keep
+# the per-commit match cheap; callers fullmatch against a stripped subject.
+_CONVENTIONAL_RE = re.compile(r"([a-z]+)(?:\(([^)]*)\))?(!)?:\s*(.+)", re.ASCII)
 
 
-def _parse_conventional_commit(subject: str) -> dict[str, str | bool] | None:
+def _parse_conventional_commit(subject: str) -> tuple[str, str, bool, str] | None:
     """Parse a conventional commit subject line.
 
-    Returns dict with keys: type, scope, bang, desc -- or None if not conventional.
+    Returns (type, scope, bang, desc) -- or None if not conventional.
     """
-    m = _CONVENTIONAL_RE.match(subject)
+    m = _CONVENTIONAL_RE.fullmatch(subject)
     if not m:
         return None
-    return {
-        "type": m.group("type"),
-        "scope": m.group("scope") or "",
-        "bang": bool(m.group("bang")),
-        "desc": m.group("desc"),
-    }
+    ctype, scope, bang, desc = m.groups()
+    return ctype, scope or "", bang is not None, desc
+
+
+_SKIP_RE = re.compile(rb"chore\(release\):|\[skip ci\]")
+
 
+def _split_records(chunks: Iterable[bytes]) -> Iterator[tuple[bytes, bytes, bytes]]:
+    """Split NUL-delimited git log output into (subject, body, sha) tuples.
 
-def _categorize_commits(raw_log: str) -> dict[str, list[str]]:
-    """Parse raw git log output and categorize into breaking/features/fixes/other.
+    Fields may straddle chunk boundaries; the incomplete tail of each chunk
+    is carried over until the next NUL (or end of input), and complete fields
+    are grouped three at a time.
+    """
+    fields: list[bytes] = []
+    pending = b""
+    for chunk in chunks:
+        *complete, pending = (pending + chunk).split(b"\0")
+        fields += complete
+        whole = len(fields) - len(fields) % 3
+        yield from zip(*[iter(fields[:whole])] * 3, strict=True)
+        del fields[:whole]
+    fields.append(pending)
+    if len(fields) == 3:
+        yield fields[0], fields[1], fields[2]
+
+
+def _categorize_commits(
+    records: Iterable[tuple[bytes, bytes, bytes]],
+) -> dict[str, list[str]]:
+    """Categorize (subject, body, sha) records into breaking/features/fixes/other.
 
     Returns dict with keys: breaking, features, fixes, other (each a list of strings).
     """
-    record_end = "<<--EOR-->>"
     breaking: list[str] = []
     features: list[str] = []
     fixes: list[str] = []
     other: list[str] = []
+    dispatch = {"feat": features.append, "fix": fixes.append}
 
-    for record in raw_log.split(record_end):
-        record = record.strip()
-        if not record:
-            continue
-        parts = record.split("\x00")
-        if len(parts) < 3:
-            continue
-        subject = parts[0].strip()
-        body = parts[1].strip()
-        sha = parts[2].strip()
+    for subject, body, sha in records:
         if not subject or not sha:
             continue
-        if "chore(release):" in subject or "[skip ci]" in subject:
+        if _SKIP_RE.search(subject):
             continue
 
-        parsed = _parse_conventional_commit(subject)
-        is_breaking = (parsed and parsed["bang"]) or "BREAKING CHANGE:" in body
-        line = f"- {subject} (`{sha}`)"
-
-        if is_breaking:
-            breaking.append(line)
-        elif parsed:
-            ctype = parsed["type"]
-            if ctype == "feat":
-                features.append(line)
-            elif ctype == "fix":
-                fixes.append(line)
-            else:
-                other.append(line)
-        else:
-            other.append(line)
+        subject_str = subject.decode("utf-8", "replace")
+        parsed = _parse_conventional_commit(subject_str)
+        # Non-conventional subjects fall through the dispatch table to "other".
+        ctype, _, bang, _ = parsed or ("", "", False, "")
+        append = (
+            breaking.append
+            if bang or b"BREAKING CHANGE:" in body
+            else dispatch.get(ctype, other.append)
+        )
+        append(f"- {subject_str} (`{sha.decode('ascii')}`)")
 
     return {
         "breaking": breaking,
@@ -213,62 +267,79 @@ def _render_markdown(
     categories: dict[str, list[str]],
     release_date: str,
 ) -> str:
-    """Render categorized commits into markdown release notes."""
-    sections: list[str] = []
+    """Render categorized commits into markdown release notes.
+
+    Lines are collected in one flat list and joined once; an empty string
+    marks the blank line that closes each paragraph.
+    """
+    parts: list[str] = []
 
     if stage == "dev":
-        sections.append(f"**Dev snapshot** `{version}` ({release_date})\n")
+        parts.extend([f"**Dev snapshot** `{version}` ({release_date})", ""])
         if prev_tag and repo:
-            sections.append(
-                f"**Changes since**: [{prev_tag}]"
-                f"(https://github.com/{repo}/compare/{prev_tag}...v{version})\n"
+            parts.extend(
+                [
+                    f"**Changes since**: [{prev_tag}]"
+                    f"(https://github.com/{repo}/compare/{prev_tag}...v{version})",
+                    "",
+                ]
             )
-        empty_message = "No notable changes (internal improvements)\n"
+        empty_message = "No notable changes (internal improvements)"
     elif stage == "rc":
-        sections.append(f"**Release candidate** `{version}` ({release_date})\n")
+        parts.extend([f"**Release candidate** `{version}` ({release_date})", ""])
         if source_tag:
-            sections.append(f"**Promoted from**: `{source_tag}`\n")
+            parts.extend([f"**Promoted from**: `{source_tag}`", ""])
         if prev_tag and repo:
-            sections.append(
-                f"**Changes since**: [{prev_tag}]"
-                f"(https://github.com/{repo}/compare/{prev_tag}...v{version})\n"
+            parts.extend(
+                [
+                    f"**Changes since**: [{prev_tag}]"
+                    f"(https://github.com/{repo}/compare/{prev_tag}...v{version})",
+                    "",
+                ]
             )
-        sections.append(
-            "## Install\n```bash\n"
-            f'pipx install nwave-ai=={version} --pip-args="--pre"\n'
-            "```\n"
+        parts.extend(
+            [
+                "## Install",
+                "```bash",
+                f'pipx install nwave-ai=={version} --pip-args="--pre"',
+                "```",
+                "",
+            ]
         )
-        empty_message = "No notable changes (internal improvements)\n"
+        empty_message = "No notable changes (internal improvements)"
     else:
-        sections.append(f"# nWave Framework v{version}\n")
-        sections.append(f"**Release Date**: {release_date}\n")
+        parts.extend([f"# nWave Framework v{version}", ""])
+        parts.extend([f"**Release Date**: {release_date}", ""])
         if source_tag:
-            sections.append(f"**Promoted from**: `{source_tag}`\n")
+            parts.extend([f"**Promoted from**: `{source_tag}`", ""])
         if prev_tag and repo:
-            sections.append(
-                f"**Full Changelog**: [{prev_tag}...v{version}]"
-                f"(https://github.com/{repo}/compare/{prev_tag}...v{version})\n"
+            parts.extend(
+                [
+                    f"**Full Changelog**: [{prev_tag}...v{version}]"
+                    f"(https://github.com/{repo}/compare/{prev_tag}...v{version})",
+                    "",
+                ]
             )
-        sections.append("## Installation\n```bash\npipx install nwave-ai\n```\n")
-        empty_message = "Patch release (internal improvements)\n"
-
-    breaking = categories.get("breaking", [])
-    features = categories.get("features", [])
-    fixes = categories.get("fixes", [])
-    other_items = categories.get("other", [])
-
-    if breaking:
-        sections.extend(["## Breaking Changes\n", "\n".join(breaking) + "\n"])
-    if features:
-        sections.extend(["## Features\n", "\n".join(features) + "\n"])
-    if fixes:
-        sections.extend(["## Bug Fixes\n", "\n".join(fixes) + "\n"])
-    if other_items:
-        sections.extend(["## Other Changes\n", "\n".join(other_items) + "\n"])
-    if not any([breaking, features, fixes, other_items]):
-        sections.append(empty_message)
-
-    return "\n".join(sections)
+        parts.extend(["## Installation", "```bash", "pipx install nwave-ai", "```", ""])
+        empty_message = "Patch release (internal improvements)"
+
+    has_changes = False
+    for heading, key in (
+        ("## Breaking Changes", "breaking"),
+        ("## Features", "features"),
+        ("## Bug Fixes", "fixes"),
+        ("## Other Changes", "other"),
+    ):
+        items = categories.get(key, [])
+        if items:
+            has_changes = True
+            parts.extend([heading, ""])
+            parts.extend(items)
+            parts.append("")
+    if not has_changes:
+        parts.extend([empty_message, ""])
+
+    return "\n".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -281,9 +352,21 @@ def main(argv: list[str] | None = None) -> None:
 
     release_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    prev_tag = _find_previous_tag(args.stage, args.version)
-    raw_log = _fetch_commits(prev_tag)
-    categories = _categorize_commits(raw_log)
+    if args.prev_tag is None:
+        prev_tag = _find_previous_tag(args.stage, args.version)
+    elif args.prev_tag and not _tag_exists(args.prev_tag):
+        print(
+            f"Error: --prev-tag '{args.prev_tag}' does not resolve to a commit",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    else:
+        prev_tag = args.prev_tag
+    try:
+        categories = _categorize_commits(_fetch_commits(prev_tag))
+    except RuntimeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
 
     notes = _render_markdown(
         stage=args.stage,
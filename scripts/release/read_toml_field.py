@@ -1,4 +1,4 @@
-"""Read a single field from a TOML file by dotted key path.
+"""Read one or more fields from a TOML file by dotted key path.
 
 Replaces fragile inline regex/line-parsing Python blocks in release-prod.yml
 with proper TOML parsing via tomllib (Python 3.11+) or tomli fallback.
@@ -6,7 +6,7 @@ with proper TOML parsing via tomllib (Python 3.11+) or tomli fallback.
 CLI:
     python -m scripts.release.read_toml_field \\
         --file PATH \\
-        --key DOTTED.KEY.PATH
+        --key DOTTED.KEY.PATH [--key DOTTED.KEY.PATH ...]
 
 Examples:
     python -m scripts.release.read_toml_field \\
@@ -15,8 +15,12 @@ Examples:
     python -m scripts.release.read_toml_field \\
         --file pyproject.toml --key tool.nwave.public_version
 
+    # Several fields from a single parse, one value per line in key order
+    python -m scripts.release.read_toml_field \\
+        --file pyproject.toml --key project.version --key project.name
+
 Exit codes:
-    0 = success (value printed to stdout)
+    0 = success (values printed to stdout)
     1 = error (file not found, key not found)
 """
 
@@ -24,7 +28,7 @@ from __future__ import annotations
 
 import argparse
 import sys
-from pathlib import Path
+from typing import Any
 
 
 try:
@@ -40,19 +44,23 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument("--file", required=True, help="Path to the TOML file")
     parser.add_argument(
-        "--key", required=True, help="Dotted key path (e.g. project.version)"
+        "--key",
+        required=True,
+        action="append",
+        dest="keys",
+        help="Dotted key path (e.g. project.version); repeat for several fields",
     )
     return parser.parse_args(argv)
 
 
 def _read_toml(path: str) -> dict:
     """Parse a TOML file and return the data as a dict."""
-    toml_path = Path(path)
-    if not toml_path.is_file():
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except (FileNotFoundError, IsADirectoryError):
         msg = f"File not found: {path}"
-        raise FileNotFoundError(msg)
-    with open(toml_path, "rb") as f:
-        return tomllib.load(f)
+        raise FileNotFoundError(msg) from None
 
 
 def _resolve_key(data: dict, dotted_key: str) -> object | None:
@@ -61,18 +69,17 @@ def _resolve_key(data: dict, dotted_key: str) -> object | None:
     Returns the value if found, or None if any segment is missing
     or a non-dict intermediate is encountered.
     """
-    current: object = data
-    for segment in dotted_key.split("."):
-        if not isinstance(current, dict):
-            return None
-        current = current.get(segment)
-        if current is None:
-            return None
+    current: Any = data
+    try:
+        for segment in dotted_key.split("."):
+            current = current[segment]
+    except (KeyError, TypeError):
+        return None
     return current
 
 
 def main(argv: list[str] | None = None) -> None:
-    """Entry point: parse args, read TOML, resolve key, print value."""
+    """Entry point: parse args, read TOML once, resolve keys, print values."""
     args = parse_args(argv)
 
     try:
@@ -81,12 +88,16 @@ def main(argv: list[str] | None = None) -> None:
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    value = _resolve_key(data, args.key)
-    if value is None:
-        print(f"Error: key '{args.key}' not found in {args.file}", file=sys.stderr)
-        sys.exit(1)
+    values = []
+    for key in args.keys:
+        value = _resolve_key(data, key)
+        if value is None:
+            print(f"Error: key '{key}' not found in {args.file}", file=sys.stderr)
+            sys.exit(1)
+        values.append(value)
 
-    print(value)
+    for value in values:
+        print(value)
 
 
 if __name__ == "__main__":
@@ -7,11 +7,18 @@ Validates that:
 - All 3 commands are registered in framework-catalog.yaml
 """
 
+import functools
 from pathlib import Path
 
 import yaml
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 COMMANDS_DIR = PROJECT_ROOT / "nWave" / "tasks" / "nw"
 CATALOG_PATH = PROJECT_ROOT / "nWave" / "framework-catalog.yaml"
@@ -20,22 +27,38 @@ SHARED_RULES_PATH = PROJECT_ROOT / "nWave" / "data" / "wizard-shared-rules.md"
 WIZARD_COMMANDS = ["new", "continue", "fast-forward"]
 
 
-def _parse_frontmatter(filepath: Path) -> dict | None:
-    """Extract YAML frontmatter from a markdown file."""
-    content = filepath.read_text(encoding="utf-8")
+# Each file is read and YAML-parsed once per session; the tests only inspect
+# the results, so sharing them across test methods is safe.
+
+
+@functools.cache
+def _read_text(filepath: Path) -> str:
+    """Read a UTF-8 file, memoized by path."""
+    return filepath.read_text(encoding="utf-8")
+
+
+def _command_text(cmd: str) -> str:
+    """Read a wizard command file, memoized through _read_text."""
+    return _read_text(COMMANDS_DIR / f"{cmd}.md")
+
+
+@functools.cache
+def _parse_frontmatter(content: str) -> dict | None:
+    """Extract YAML frontmatter from markdown content."""
     if not content.startswith("---\n"):
         return None
     end_pos = content.index("\n---\n", 4) if "\n---\n" in content[4:] else None
     if end_pos is None:
         return None
     yaml_block = content[4:end_pos]
-    return yaml.safe_load(yaml_block)
+    return yaml.load(yaml_block, Loader=SafeLoader)
 
 
+@functools.cache
 def _load_catalog_commands() -> dict:
     """Load command metadata from framework-catalog.yaml."""
     with open(CATALOG_PATH, encoding="utf-8") as f:
-        catalog = yaml.safe_load(f)
+        catalog = yaml.load(f, Loader=SafeLoader)
     return catalog.get("commands", {})
 
 
@@ -51,16 +74,14 @@ class TestWizardCommandFiles:
     def test_all_wizard_files_have_frontmatter(self):
         """Every wizard command file must have YAML frontmatter with description."""
         for cmd in WIZARD_COMMANDS:
-            filepath = COMMANDS_DIR / f"{cmd}.md"
-            fm = _parse_frontmatter(filepath)
+            fm = _parse_frontmatter(_command_text(cmd))
             assert fm is not None, f"{cmd}.md missing frontmatter"
             assert "description" in fm, f"{cmd}.md frontmatter missing description"
 
     def test_wizard_files_have_disable_model_invocation(self):
         """Wizard commands run in main instance, must have disable-model-invocation: true."""
         for cmd in WIZARD_COMMANDS:
-            filepath = COMMANDS_DIR / f"{cmd}.md"
-            fm = _parse_frontmatter(filepath)
+            fm = _parse_frontmatter(_command_text(cmd))
             assert fm is not None, f"{cmd}.md missing frontmatter"
             assert fm.get("disable-model-invocation") is True, (
                 f"{cmd}.md must have disable-model-invocation: true"
@@ -78,27 +99,27 @@ class TestSharedRulesReferences:
 
     def test_shared_rules_has_project_id_section(self):
         """Shared rules must contain Project ID Derivation section."""
-        content = SHARED_RULES_PATH.read_text(encoding="utf-8")
+        content = _read_text(SHARED_RULES_PATH)
         assert "## Project ID Derivation" in content
 
     def test_shared_rules_has_wave_detection_section(self):
         """Shared rules must contain Wave Detection Rules section."""
-        content = SHARED_RULES_PATH.read_text(encoding="utf-8")
+        content = _read_text(SHARED_RULES_PATH)
         assert "## Wave Detection Rules" in content
 
     def test_new_references_shared_rules(self):
         """new.md must reference shared rules for project ID derivation."""
-        content = (COMMANDS_DIR / "new.md").read_text(encoding="utf-8")
+        content = _command_text("new")
         assert "wizard-shared-rules.md" in content
 
     def test_continue_references_shared_rules(self):
         """continue.md must reference shared rules for wave detection."""
-        content = (COMMANDS_DIR / "continue.md").read_text(encoding="utf-8")
+        content = _command_text("continue")
         assert "wizard-shared-rules.md" in content
 
     def test_fast_forward_references_shared_rules(self):
         """fast-forward.md must reference shared rules."""
-        content = (COMMANDS_DIR / "fast-forward.md").read_text(encoding="utf-8")
+        content = _command_text("fast-forward")
         assert "wizard-shared-rules.md" in content
 
 
@@ -113,13 +134,13 @@ class TestFastForwardNaming:
 
     def test_fast_forward_uses_correct_command_name(self):
         """fast-forward.md must reference /nw:fast-forward, not /nw:ff."""
-        content = (COMMANDS_DIR / "fast-forward.md").read_text(encoding="utf-8")
+        content = _command_text("fast-forward")
         assert "/nw:fast-forward" in content
         assert "/nw:ff" not in content
 
     def test_fast_forward_uses_correct_header(self):
         """fast-forward.md must use NW-FAST-FORWARD header, not NW-FF."""
-        content = (COMMANDS_DIR / "fast-forward.md").read_text(encoding="utf-8")
+        content = _command_text("fast-forward")
         assert "NW-FAST-FORWARD" in content
 
 
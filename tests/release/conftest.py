@@ -2,12 +2,33 @@
 
 Provides mock GitHub API responses and common test data
 for ci_gate, next_version, trace_message, patch_pyproject,
-and discover_tag tests.
+and discover_tag tests, plus throwaway git repositories for
+the integration tests that need one.
+
+The suite is safe to distribute across workers; the recommended
+invocation is ``pytest -n auto --dist loadgroup tests/release``. Tests
+that drive real git repositories are pinned to a single
+``xdist_group("git")`` so they share one worker, and are marked
+``integration`` so ``-m "not integration"`` runs only the pure tests.
 """
 
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
 
+# libgit2 bindings build commits in-process; without them, seeding falls back
+# to a single git fast-import run per call.
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
 # ---------------------------------------------------------------------------
 # GitHub API: Check Runs responses
 # ---------------------------------------------------------------------------
@@ -128,45 +149,50 @@ testpaths = ["tests"]
 # Tag discovery: sample tag lists for discover_tag.py tests
 # ---------------------------------------------------------------------------
 
+_DEV_TAGS_MIXED = ("v1.1.22.dev1", "v1.1.22.dev2", "v1.1.23.dev1")
+_DEV_TAGS_DT = tuple(f"v1.1.23.dev{n}" for n in range(1, 12))
+_RC_TAGS_MIXED = ("v1.1.22rc1", "v1.1.22rc2", "v1.1.23rc1")
+_RC_TAGS_DT = tuple(f"v1.1.23rc{n}" for n in range(1, 12))
 
-@pytest.fixture()
-def dev_tags_mixed_versions() -> list[str]:
+
+@pytest.fixture(scope="session")
+def dev_tags_mixed_versions() -> tuple[str, ...]:
     """Dev tags across two base versions (1.1.22 and 1.1.23).
 
     Expected highest: v1.1.23.dev1 (cross-base semantic comparison).
     """
-    return ["v1.1.22.dev1", "v1.1.22.dev2", "v1.1.23.dev1"]
+    return _DEV_TAGS_MIXED
 
 
-@pytest.fixture()
-def dev_tags_digit_transition() -> list[str]:
+@pytest.fixture(scope="session")
+def dev_tags_digit_transition() -> tuple[str, ...]:
     """11 dev tags for version 1.1.23: dev1 through dev11.
 
     Proves 1-digit to 2-digit sort correctness.
     String sort would give dev9 > dev11. packaging.Version gives dev11.
     Must have exactly 11 entries.
     """
-    return [f"v1.1.23.dev{n}" for n in range(1, 12)]
+    return _DEV_TAGS_DT
 
 
-@pytest.fixture()
-def rc_tags_mixed() -> list[str]:
+@pytest.fixture(scope="session")
+def rc_tags_mixed() -> tuple[str, ...]:
     """RC tags across two base versions (1.1.22 and 1.1.23).
 
     Expected highest: v1.1.23rc1 (cross-base semantic comparison).
     """
-    return ["v1.1.22rc1", "v1.1.22rc2", "v1.1.23rc1"]
+    return _RC_TAGS_MIXED
 
 
-@pytest.fixture()
-def rc_tags_digit_transition() -> list[str]:
+@pytest.fixture(scope="session")
+def rc_tags_digit_transition() -> tuple[str, ...]:
     """11 RC tags for version 1.1.23: rc1 through rc11.
 
     Proves 1-digit to 2-digit sort correctness.
     String sort would give rc9 > rc11. packaging.Version gives rc11.
     Must have exactly 11 entries.
     """
-    return [f"v1.1.23rc{n}" for n in range(1, 12)]
+    return _RC_TAGS_DT
 
 
 @pytest.fixture()
@@ -175,9 +201,245 @@ def sample_pyproject_content() -> str:
     return SAMPLE_PYPROJECT
 
 
+@pytest.fixture(scope="session")
+def _sample_pyproject_template(tmp_path_factory):
+    """Sample pyproject.toml written once for the whole session."""
+    p = tmp_path_factory.mktemp("pyproj_tmpl") / "pyproject.toml"
+    p.write_text(SAMPLE_PYPROJECT)
+    return p
+
+
+@pytest.fixture()
+def sample_pyproject_path(tmp_path, _sample_pyproject_template) -> str:
+    """Copy the sample pyproject.toml into a temp dir and return the path."""
+    dest = tmp_path / "pyproject.toml"
+    shutil.copyfile(_sample_pyproject_template, dest)
+    return str(dest)
+
+
+# ---------------------------------------------------------------------------
+# Git repositories: one initialized template per session, copied per test
+# ---------------------------------------------------------------------------
+
+_GIT_REPO_FIXTURES = frozenset({"fresh_git_repo", "tagged_git_repo"})
+
+
+def _uses_git_repo(item) -> bool:
+    """Whether a collected test receives a real git repository."""
+    return bool(_GIT_REPO_FIXTURES.intersection(getattr(item, "fixturenames", ())))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark the git-repo tests as integration and keep them on one xdist worker."""
+    group = config.pluginmanager.hasplugin("xdist")
+    here = Path(__file__).parent
+    for item in items:
+        if item.path.is_relative_to(here) and _uses_git_repo(item):
+            item.add_marker(pytest.mark.integration)
+            if group:
+                item.add_marker(pytest.mark.xdist_group("git"))
+
+
+def _build_git_test_env() -> dict[str, str]:
+    """Environment for every git spawned against a throwaway test repo.
+
+    The user's global and system config are ignored and a fixed identity is
+    supplied, so no test needs ``git config``. Read-only commands skip the
+    optional index.lock refresh, and core.fsync is switched off (git >= 2.36;
+    older versions ignore it) since nothing written to a test repo needs to
+    survive a crash. The fsync override is appended after any
+    GIT_CONFIG_COUNT entries already in the environment rather than
+    replacing them.
+    """
+    count = int(os.environ.get("GIT_CONFIG_COUNT") or 0)
+    env = {
+        "GIT_CONFIG_GLOBAL": os.devnull,
+        "GIT_CONFIG_NOSYSTEM": "1",
+        "GIT_OPTIONAL_LOCKS": "0",
+        f"GIT_CONFIG_KEY_{count}": "core.fsync",
+        f"GIT_CONFIG_VALUE_{count}": "none",
+        "GIT_CONFIG_COUNT": str(count + 1),
+    }
+    for role in ("AUTHOR", "COMMITTER"):
+        env[f"GIT_{role}_NAME"] = "Test"
+        env[f"GIT_{role}_EMAIL"] = "test@example.com"
+    return env
+
+
+_GIT_TEST_ENV = _build_git_test_env()
+
+
 @pytest.fixture()
-def sample_pyproject_path(tmp_path, sample_pyproject_content) -> str:
-    """Write sample pyproject.toml to a temp file and return the path."""
-    p = tmp_path / "pyproject.toml"
-    p.write_text(sample_pyproject_content)
-    return str(p)
+def _git_test_environment(monkeypatch):
+    """Apply the test git environment for one test that uses a git repo."""
+    for name, value in _GIT_TEST_ENV.items():
+        monkeypatch.setenv(name, value)
+
+
+def _git(path, *command):
+    """Run a git command in the given repo directory.
+
+    stdout is discarded; stderr is kept only so a failure reports it.
+    """
+    subprocess.run(
+        ["git", *command],
+        cwd=str(path),
+        env={**os.environ, **_GIT_TEST_ENV},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+
+
+def _init_git_repo(path):
+    """Initialize a git repo in the given directory.
+
+    No identity is configured; the test git environment supplies it.
+    """
+    # An empty --template skips copying the sample hooks into .git.
+    _git(path, "init", "--quiet", "--initial-branch=main", "--template=")
+
+
+_COMMITTER = "Test <test@example.com> now"
+
+
+_SEED_REF_PREFIXES = {"tag": "refs/tags/", "branch": "refs/heads/"}
+
+
+def _seed_repo(path, ops):
+    """Append commits and tags to main, in-process when pygit2 is available.
+
+    ops is a sequence of ("commit", message), ("tag", name) and
+    ("branch", name) pairs applied in order; each commit is empty and each
+    tag (lightweight) or branch points at the latest commit (or at the
+    existing HEAD if no commit precedes it).
+    """
+    if pygit2 is None:
+        _seed_repo_fast_import(path, ops)
+    else:
+        _seed_repo_pygit2(path, ops)
+
+
+def _seed_repo_pygit2(path, ops):
+    """Apply seed ops to main through libgit2, without spawning git."""
+    repo = pygit2.Repository(str(path))
+    signature = pygit2.Signature("Test", "test@example.com")
+    empty_tree = repo.TreeBuilder().write()
+    tip = None if repo.head_is_unborn else repo.head.target
+    for kind, arg in ops:
+        if kind == "commit":
+            parents = [] if tip is None else [tip]
+            tip = repo.create_commit(
+                "HEAD", signature, signature, arg, empty_tree, parents
+            )
+        elif kind in _SEED_REF_PREFIXES:
+            if tip is None:
+                msg = f"Cannot create {kind} {arg!r} before the first commit"
+                raise ValueError(msg)
+            repo.references.create(f"{_SEED_REF_PREFIXES[kind]}{arg}", tip)
+        else:
+            msg = f"Unknown seed op: {kind!r}"
+            raise ValueError(msg)
+
+
+def _seed_repo_fast_import(path, ops):
+    """Apply seed ops to main with a single git fast-import run."""
+    # fast-import does not pick up an existing branch tip by itself.
+    tip = "refs/heads/main^0"
+    if not (Path(path) / ".git" / "refs" / "heads" / "main").exists():
+        tip = None
+    stream = []
+    for mark, (kind, arg) in enumerate(ops, start=1):
+        if kind == "commit":
+            data = arg.encode()
+            stream.append(
+                b"commit refs/heads/main\nmark :%d\ncommitter %s\ndata %d\n%s\n"
+                % (mark, _COMMITTER.encode(), len(data), data)
+            )
+            if tip is not None:
+                stream.append(b"from %s\n" % tip.encode())
+            stream.append(b"\n")
+            tip = f":{mark}"
+        elif kind in _SEED_REF_PREFIXES:
+            if tip is None:
+                msg = f"Cannot create {kind} {arg!r} before the first commit"
+                raise ValueError(msg)
+            ref = f"{_SEED_REF_PREFIXES[kind]}{arg}"
+            stream.append(b"reset %s\nfrom %s\n\n" % (ref.encode(), tip.encode()))
+        else:
+            msg = f"Unknown seed op: {kind!r}"
+            raise ValueError(msg)
+    subprocess.run(
+        ["git", "fast-import", "--quiet", "--date-format=now"],
+        cwd=str(path),
+        env={**os.environ, **_GIT_TEST_ENV},
+        input=b"".join(stream),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+
+
+def run_main(capsys, main, argv: list[str]) -> SimpleNamespace:
+    """Run a release script's main(argv) in-process.
+
+    Returns a CompletedProcess-like result: the SystemExit code (0 when main
+    returns normally) and the stdout/stderr captured by capsys.
+    """
+    returncode = 0
+    try:
+        main(argv)
+    except SystemExit as exc:
+        returncode = exc.code or 0
+    out, err = capsys.readouterr()
+    return SimpleNamespace(returncode=returncode, stdout=out, stderr=err)
+
+
+@pytest.fixture(scope="session")
+def seed_repo():
+    """Return the repo seeding helper: seed_repo(path, ops)."""
+    return _seed_repo
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory):
+    """An empty git repo created once for the whole session."""
+    base = tmp_path_factory.mktemp("git_template")
+    _init_git_repo(base)
+    return base
+
+
+@pytest.fixture()
+def fresh_git_repo(_git_test_environment, _git_repo_template, tmp_path):
+    """A private copy of the template repo, ready for commits and tags."""
+    repo = tmp_path / "repo"
+    shutil.copytree(_git_repo_template, repo)
+    return repo
+
+
+@pytest.fixture(scope="session")
+def _tagged_repo_templates(_git_repo_template, tmp_path_factory):
+    """Build, once per tag name, a repo with one 'initial commit' tagged at HEAD."""
+    templates = {}
+
+    def build(tag_name):
+        if tag_name not in templates:
+            base = tmp_path_factory.mktemp(f"git_template_{tag_name}")
+            shutil.copytree(_git_repo_template, base, dirs_exist_ok=True)
+            _seed_repo(base, [("commit", "initial commit"), ("tag", tag_name)])
+            templates[tag_name] = base
+        return templates[tag_name]
+
+    return build
+
+
+@pytest.fixture()
+def tagged_git_repo(_git_test_environment, _tagged_repo_templates, tmp_path):
+    """Return a factory copying the tagged template for tag_name into tmp_path."""
+
+    def make(tag_name):
+        repo = tmp_path / "repo"
+        shutil.copytree(_tagged_repo_templates(tag_name), repo)
+        return repo
+
+    return make
@@ -1,8 +1,9 @@
 """Tests for scripts/release/bump_version.py
 
 Extracts inline version-bump logic from release-prod.yml into a testable
-standalone script.  Tests run the script via subprocess to validate the
-real CLI contract.
+standalone script.  Tests call the script's main() in-process, capturing
+stdout/stderr and the exit code; a single subprocess smoke test guards the
+real ``python -m`` CLI contract.
 
 BDD scenario mapping:
   - release-prod.yml "Bump version in pyproject.toml and framework-catalog.yaml"
@@ -13,15 +14,33 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from typing import TYPE_CHECKING
 
+import pytest
+import yaml
 
-def _run_bump(args: list[str], cwd: str | None = None) -> subprocess.CompletedProcess:
+from scripts.release import bump_version as _bv
+from tests.release.conftest import run_main
+
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+
+_BUMP_CMD = (sys.executable, "-m", "scripts.release.bump_version")
+
+
+def _run_bump(capsys, args: list[str]) -> SimpleNamespace:
+    """Run bump_version.main() in-process and return a CompletedProcess-like result."""
+    return run_main(capsys, _bv.main, args)
+
+
+def _run_bump_cli(args: list[str]) -> subprocess.CompletedProcess:
     """Run bump_version.py as a subprocess and return the result."""
     return subprocess.run(
-        [sys.executable, "-m", "scripts.release.bump_version", *args],
+        [*_BUMP_CMD, *args],
         capture_output=True,
         text=True,
-        cwd=cwd,
     )
 
 
@@ -33,20 +52,22 @@ def _run_bump(args: list[str], cwd: str | None = None) -> subprocess.CompletedPr
 class TestPyprojectBump:
     """Version bumping in pyproject.toml."""
 
-    def test_bumps_version_in_pyproject_toml(self, tmp_path):
+    def test_bumps_version_in_pyproject_toml(self, capsys, tmp_path):
         """Given a pyproject.toml with version = "0.0.0",
         when bumping to "1.2.3",
         then the file contains version = "1.2.3"."""
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text('[project]\nname = "example"\nversion = "0.0.0"\n')
 
-        result = _run_bump(["--version", "1.2.3", "--pyproject", str(pyproject)])
+        result = _run_bump(
+            capsys, ["--version", "1.2.3", "--pyproject", str(pyproject)]
+        )
 
         assert result.returncode == 0
         content = pyproject.read_text()
         assert 'version = "1.2.3"' in content
 
-    def test_only_first_version_field_is_bumped(self, tmp_path):
+    def test_only_first_version_field_is_bumped(self, capsys, tmp_path):
         """Given a pyproject.toml with version in both [project] and [tool.x],
         when bumping,
         then only the first occurrence is changed."""
@@ -57,18 +78,39 @@ class TestPyprojectBump:
             'version = "9.9.9"\n'
         )
 
-        result = _run_bump(["--version", "1.2.3", "--pyproject", str(pyproject)])
+        result = _run_bump(
+            capsys, ["--version", "1.2.3", "--pyproject", str(pyproject)]
+        )
 
         assert result.returncode == 0
         content = pyproject.read_text()
         assert 'version = "1.2.3"' in content
         assert 'version = "9.9.9"' in content
 
-    def test_missing_pyproject_exits_with_error(self, tmp_path):
+    def test_bumps_version_declared_after_long_header(self, capsys, tmp_path):
+        """Given a pyproject.toml whose version field sits beyond the first 4 KiB,
+        when bumping,
+        then the field is still found and replaced."""
+        pyproject = tmp_path / "pyproject.toml"
+        padding = "".join(f"# comment line {n}\n" for n in range(400))
+        pyproject.write_text(
+            f'{padding}[project]\nname = "example"\nversion = "0.0.0"\n'
+        )
+
+        result = _run_bump(
+            capsys, ["--version", "1.2.3", "--pyproject", str(pyproject)]
+        )
+
+        assert result.returncode == 0
+        content = pyproject.read_text()
+        assert 'version = "1.2.3"' in content
+        assert content.startswith(padding)
+
+    def test_missing_pyproject_exits_with_error(self, capsys, tmp_path):
         """Given --pyproject points to nonexistent file,
         then exit code is 1."""
         result = _run_bump(
-            ["--version", "1.2.3", "--pyproject", str(tmp_path / "nope.toml")]
+            capsys, ["--version", "1.2.3", "--pyproject", str(tmp_path / "nope.toml")]
         )
 
         assert result.returncode == 1
@@ -83,38 +125,80 @@ class TestPyprojectBump:
 class TestCatalogBump:
     """Version bumping in framework-catalog.yaml."""
 
-    def test_bumps_version_in_catalog_yaml(self, tmp_path):
+    def test_bumps_version_in_catalog_yaml(self, capsys, tmp_path):
         """Given a catalog YAML with version: "0.0.0",
         when bumping to "1.2.3",
         then the file contains version: '1.2.3'."""
         catalog = tmp_path / "catalog.yaml"
         catalog.write_text("name: nWave\nversion: '0.0.0'\ndescription: test\n")
 
-        result = _run_bump(["--version", "1.2.3", "--catalog", str(catalog)])
+        result = _run_bump(capsys, ["--version", "1.2.3", "--catalog", str(catalog)])
 
         assert result.returncode == 0
         content = catalog.read_text()
         assert "version: 1.2.3" in content or "version: '1.2.3'" in content
 
-    def test_preserves_other_catalog_fields(self, tmp_path):
+    def test_preserves_other_catalog_fields(self, capsys, tmp_path):
         """Given a catalog with name, version, and description,
         when bumping version,
         then name and description are unchanged."""
         catalog = tmp_path / "catalog.yaml"
         catalog.write_text("name: nWave\nversion: '0.0.0'\ndescription: My framework\n")
 
-        result = _run_bump(["--version", "1.2.3", "--catalog", str(catalog)])
+        result = _run_bump(capsys, ["--version", "1.2.3", "--catalog", str(catalog)])
 
         assert result.returncode == 0
         content = catalog.read_text()
         assert "name: nWave" in content
         assert "description: My framework" in content
 
-    def test_missing_catalog_exits_with_error(self, tmp_path):
+    def test_preserves_comments_and_nested_version_keys(self, capsys, tmp_path):
+        """Given a catalog with comments and a nested version key,
+        when bumping version,
+        then only the top-level version value changes."""
+        catalog = tmp_path / "catalog.yaml"
+        original = (
+            "# nWave framework catalog\n"
+            "name: nWave\n"
+            "version: 0.0.0  # bumped by release train\n"
+            "tools:\n"
+            "  version: 9.9.9\n"
+        )
+        catalog.write_text(original)
+
+        result = _run_bump(capsys, ["--version", "1.2.3", "--catalog", str(catalog)])
+
+        assert result.returncode == 0
+        assert catalog.read_text() == original.replace(
+            "version: 0.0.0", "version: 1.2.3"
+        )
+
+    @pytest.mark.parametrize(
+        "original",
+        [
+            "version: &v 0.0.0\nother: *v\n",
+            "version: >\n  0.0.0\nname: nWave\n",
+            "version: !!str 0.0.0\nname: nWave\n",
+        ],
+        ids=["anchored", "block-scalar", "tagged"],
+    )
+    def test_non_plain_version_value_still_loads(self, capsys, tmp_path, original):
+        """Given a version value with an anchor, block indicator or tag,
+        when bumping version,
+        then the catalog still loads and its version is the new one."""
+        catalog = tmp_path / "catalog.yaml"
+        catalog.write_text(original)
+
+        result = _run_bump(capsys, ["--version", "1.2.3", "--catalog", str(catalog)])
+
+        assert result.returncode == 0
+        assert yaml.safe_load(catalog.read_text())["version"] == "1.2.3"
+
+    def test_missing_catalog_exits_with_error(self, capsys, tmp_path):
         """Given --catalog points to nonexistent file,
         then exit code is 1."""
         result = _run_bump(
-            ["--version", "1.2.3", "--catalog", str(tmp_path / "nope.yaml")]
+            capsys, ["--version", "1.2.3", "--catalog", str(tmp_path / "nope.yaml")]
         )
 
         assert result.returncode == 1
@@ -129,7 +213,7 @@ class TestCatalogBump:
 class TestBothFiles:
     """Bumping both files in a single invocation."""
 
-    def test_bumps_both_pyproject_and_catalog(self, tmp_path):
+    def test_bumps_both_pyproject_and_catalog(self, capsys, tmp_path):
         """Given both --pyproject and --catalog are provided,
         when bumping to "1.2.3",
         then both files are updated."""
@@ -139,6 +223,7 @@ class TestBothFiles:
         catalog.write_text("name: nWave\nversion: '0.0.0'\n")
 
         result = _run_bump(
+            capsys,
             [
                 "--version",
                 "1.2.3",
@@ -146,7 +231,7 @@ class TestBothFiles:
                 str(pyproject),
                 "--catalog",
                 str(catalog),
-            ]
+            ],
         )
 
         assert result.returncode == 0
@@ -165,12 +250,34 @@ class TestBothFiles:
 class TestValidation:
     """Input validation."""
 
-    def test_no_files_specified_exits_with_error(self):
+    def test_no_files_specified_exits_with_error(self, capsys):
         """Given neither --pyproject nor --catalog is provided,
         then exit code is non-zero with error message."""
-        result = _run_bump(["--version", "1.2.3"])
+        result = _run_bump(capsys, ["--version", "1.2.3"])
 
         assert result.returncode != 0
         assert (
             "at least one" in result.stderr.lower() or "error" in result.stderr.lower()
         )
+
+
+# ---------------------------------------------------------------------------
+# CLI contract
+# ---------------------------------------------------------------------------
+
+
+class TestCliContract:
+    """The script still works as ``python -m scripts.release.bump_version``."""
+
+    def test_module_invocation_bumps_file_and_reports(self, tmp_path):
+        """Given a real subprocess invocation,
+        when bumping a pyproject.toml,
+        then it exits 0, rewrites the file and reports on stdout."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "example"\nversion = "0.0.0"\n')
+
+        result = _run_bump_cli(["--version", "1.2.3", "--pyproject", str(pyproject)])
+
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        assert 'version = "1.2.3"' in pyproject.read_text()
+        assert "1.2.3" in result.stdout
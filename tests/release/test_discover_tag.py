@@ -3,7 +3,7 @@
 Discovers the highest semantic version tag for a given pattern (dev or rc).
 Uses packaging.Version to guarantee integer sort (dev10 > dev9, rc10 > rc9).
 
-Scenario inventory (15 scenarios, 6 error/edge = 40%):
+Scenario inventory (24 scenarios, 9 error/edge = 38%):
 
   Walking skeleton:
     1. Auto-discover highest dev tag from a tag list
@@ -12,56 +12,75 @@ Scenario inventory (15 scenarios, 6 error/edge = 40%):
     2. Mixed base versions return globally highest dev tag
 
   Dev sort correctness:
-    3. Digit transition: dev11 beats dev9 with 11 tags (1-digit to 2-digit)
+    3. Digit transition: dev11 beats dev9 with 11 tags read from --tag-file
 
   RC happy path:
     4. Auto-discover highest RC tag from a tag list
 
   RC sort correctness:
-    5. Digit transition: rc11 beats rc9 with 11 tags (1-digit to 2-digit)
+    5. Digit transition: rc11 beats rc9 with 11 tags read from --tag-file
 
   Explicit tag validation:
     6. Validate existing tag returns it directly
     7. Validate missing tag returns not-found error
+    8. Validated tag is reported verbatim, without Version normalization
 
   Error paths:
-    8. No dev tags returns not-found with Stage 1 guidance
-    9. No RC tags returns not-found with Stage 2 guidance
-   10. Invalid pattern returns exit code 2
-   11. Invalid tags are filtered; valid ones still sorted correctly
+    9. No dev tags returns not-found with Stage 1 guidance
+   10. No RC tags returns not-found with Stage 2 guidance
+   11. Invalid pattern returns exit code 2
+   12. Invalid tags are filtered; valid ones still sorted correctly
+   13. Unreadable --tag-file returns exit code 2
+   14. Non-UTF-8 --tag-file returns exit code 2
 
   Staleness detection (integration, requires tmp_path git repo):
-   12. Tag at HEAD shows zero commits behind
-   13. Tag behind HEAD shows correct commit count
-   14. commits_behind is null when --tag-list is provided
+   15. Tag at HEAD shows zero commits behind
+   16. Tag behind HEAD shows correct commit count
+   17. commits_behind is null when --tag-list is provided
+
+  Tags read from git (integration, requires tmp_path git repo):
+   18. Validate finds a tag that shares its name with a branch
+   19. Discovery finds a tag that shares its name with a branch
+   20. Discovery from git uses packaging.Version order (dev11 > dev9,
+       rc1 > rc1.dev2), not git's version sort
+   21. Discovery from git finds non-canonical spellings packaging accepts
+       (v1.2.0c1 as rc, v1.2.0.DEV3 as dev)
 
   Edge cases:
-   15. Empty tag list string treated as no tags
+   22. Empty tag list string treated as no tags
+   23. Equal versions resolve to the same tag regardless of input order
+
+  CLI contract:
+   24. Script runs standalone by path (subprocess smoke test)
 """
 
 import json
 import subprocess
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from scripts.release import discover_tag as _discover
+from tests.release.conftest import run_main
 
 
 SCRIPT = "scripts/release/discover_tag.py"
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_DISCOVER_CMD = (sys.executable, str(_PROJECT_ROOT / SCRIPT))
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def run_discover_tag(*args: str) -> subprocess.CompletedProcess:
-    """Run discover_tag.py as a subprocess, returning the CompletedProcess."""
-    return subprocess.run(
-        [sys.executable, SCRIPT, *args],
-        capture_output=True,
-        text=True,
-    )
+def run_discover_tag(capsys, *args: str) -> SimpleNamespace:
+    """Run discover_tag.main() in-process, returning a CompletedProcess-like result."""
+    return run_main(capsys, _discover.main, list(args))
 
 
-def parse_output(result: subprocess.CompletedProcess) -> dict:
-    """Parse JSON output from a subprocess run."""
+def parse_output(result) -> dict:
+    """Parse JSON output from a discover_tag run."""
     return json.loads(result.stdout.strip())
 
 
@@ -76,13 +95,13 @@ class TestWalkingSkeleton:
     and returns JSON with found: true and the correct tag.
     """
 
-    def test_auto_discover_highest_dev_tag(self, dev_tags_mixed_versions):
+    def test_auto_discover_highest_dev_tag(self, capsys, dev_tags_mixed_versions):
         """Given dev tags for versions 1.1.22 and 1.1.23 exist,
         when discovering the latest dev tag,
         then the highest semantic version v1.1.23.dev1 is returned.
         """
         tag_list = ",".join(dev_tags_mixed_versions)
-        result = run_discover_tag("--pattern", "dev", "--tag-list", tag_list)
+        result = run_discover_tag(capsys, "--pattern", "dev", "--tag-list", tag_list)
 
         assert result.returncode == 0, f"stderr: {result.stderr}"
         output = parse_output(result)
@@ -99,14 +118,14 @@ class TestDevTagHappyPath:
     """Dev tag auto-discovery selects the highest semantic version."""
 
     def test_mixed_base_versions_returns_globally_highest(
-        self, dev_tags_mixed_versions
+        self, capsys, dev_tags_mixed_versions
     ):
         """Given dev tags across base versions 1.1.22 and 1.1.23,
         when discovering the latest dev tag,
         then v1.1.23.dev1 wins over v1.1.22.dev2 (cross-base comparison).
         """
         tag_list = ",".join(dev_tags_mixed_versions)
-        result = run_discover_tag("--pattern", "dev", "--tag-list", tag_list)
+        result = run_discover_tag(capsys, "--pattern", "dev", "--tag-list", tag_list)
 
         assert result.returncode == 0
         output = parse_output(result)
@@ -116,30 +135,43 @@ class TestDevTagHappyPath:
 
 
 # ===========================================================================
-# Dev tag sort correctness: integer sort, not string sort
+# Tag sort correctness: integer sort, not string sort
 # ===========================================================================
-class TestDevTagDigitTransition:
-    """packaging.Version sort guarantees dev10 > dev9, dev11 > dev10."""
-
-    def test_digit_transition_dev11_beats_dev9(self, dev_tags_digit_transition):
-        """Given 11 dev tags (dev1 through dev11) for version 1.1.23,
-        when discovering the latest dev tag,
-        then v1.1.23.dev11 is returned (not dev9 from string sort).
+class TestDigitTransition:
+    """packaging.Version sort guarantees dev11 > dev9 and rc11 > rc9."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "tags_fixture", "expected"),
+        [
+            ("dev", "dev_tags_digit_transition", "v1.1.23.dev11"),
+            ("rc", "rc_tags_digit_transition", "v1.1.23rc11"),
+        ],
+    )
+    def test_digit_transition_11_beats_9(
+        self, capsys, request, tmp_path, pattern, tags_fixture, expected
+    ):
+        """Given 11 dev or RC tags (1 through 11) for version 1.1.23,
+        when discovering the latest tag for that pattern,
+        then the 11th tag is returned (not the 9th from string sort).
 
         This is the critical behavioral test that enforces packaging.Version
         over string sort or bash sort -V.
         """
-        assert len(dev_tags_digit_transition) == 11, (
+        tags = request.getfixturevalue(tags_fixture)
+        assert len(tags) == 11, (
             "Fixture must have exactly 11 entries to prove 1-digit to 2-digit transition"
         )
 
-        tag_list = ",".join(dev_tags_digit_transition)
-        result = run_discover_tag("--pattern", "dev", "--tag-list", tag_list)
+        tag_file = tmp_path / "tags.txt"
+        tag_file.write_text("\n".join(tags))
+        result = run_discover_tag(
+            capsys, "--pattern", pattern, "--tag-file", str(tag_file)
+        )
 
         assert result.returncode == 0
         output = parse_output(result)
-        assert output["tag"] == "v1.1.23.dev11"
-        assert output["version"] == "1.1.23.dev11"
+        assert output["tag"] == expected
+        assert output["version"] == expected.lstrip("v")
 
 
 # ===========================================================================
@@ -148,13 +180,13 @@ class TestDevTagDigitTransition:
 class TestRCTagHappyPath:
     """RC tag auto-discovery selects the highest semantic version."""
 
-    def test_auto_discover_highest_rc_tag(self, rc_tags_mixed):
+    def test_auto_discover_highest_rc_tag(self, capsys, rc_tags_mixed):
         """Given RC tags for versions 1.1.22 and 1.1.23 exist,
         when discovering the latest RC tag,
         then the highest semantic version v1.1.23rc1 is returned.
         """
         tag_list = ",".join(rc_tags_mixed)
-        result = run_discover_tag("--pattern", "rc", "--tag-list", tag_list)
+        result = run_discover_tag(capsys, "--pattern", "rc", "--tag-list", tag_list)
 
         assert result.returncode == 0
         output = parse_output(result)
@@ -163,45 +195,22 @@ class TestRCTagHappyPath:
         assert output["version"] == "1.1.23rc1"
 
 
-# ===========================================================================
-# RC tag sort correctness: integer sort, not string sort
-# ===========================================================================
-class TestRCTagDigitTransition:
-    """packaging.Version sort guarantees rc10 > rc9, rc11 > rc10."""
-
-    def test_digit_transition_rc11_beats_rc9(self, rc_tags_digit_transition):
-        """Given 11 RC tags (rc1 through rc11) for version 1.1.23,
-        when discovering the latest RC tag,
-        then v1.1.23rc11 is returned (not rc9 from string sort).
-
-        This is the critical behavioral test for RC integer sort.
-        """
-        assert len(rc_tags_digit_transition) == 11, (
-            "Fixture must have exactly 11 entries to prove 1-digit to 2-digit transition"
-        )
-
-        tag_list = ",".join(rc_tags_digit_transition)
-        result = run_discover_tag("--pattern", "rc", "--tag-list", tag_list)
-
-        assert result.returncode == 0
-        output = parse_output(result)
-        assert output["tag"] == "v1.1.23rc11"
-        assert output["version"] == "1.1.23rc11"
-
-
 # ===========================================================================
 # Explicit tag validation
 # ===========================================================================
 class TestExplicitTagValidation:
     """When a user provides an explicit tag, validate it exists in the list."""
 
-    def test_validate_existing_tag_returns_it_directly(self, dev_tags_mixed_versions):
+    def test_validate_existing_tag_returns_it_directly(
+        self, capsys, dev_tags_mixed_versions
+    ):
         """Given dev tag v1.1.22.dev2 exists in the tag list,
         when validating that specific tag,
         then it is returned directly without discovery sort.
         """
         tag_list = ",".join(dev_tags_mixed_versions)
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "dev",
             "--validate",
@@ -216,13 +225,16 @@ class TestExplicitTagValidation:
         assert output["tag"] == "v1.1.22.dev2"
         assert output["version"] == "1.1.22.dev2"
 
-    def test_validate_missing_tag_returns_not_found(self, dev_tags_mixed_versions):
+    def test_validate_missing_tag_returns_not_found(
+        self, capsys, dev_tags_mixed_versions
+    ):
         """Given dev tag v9.9.9.dev1 does NOT exist in the tag list,
         when validating that specific tag,
         then exit code is 1 and error indicates tag not found.
         """
         tag_list = ",".join(dev_tags_mixed_versions)
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "dev",
             "--validate",
@@ -237,6 +249,26 @@ class TestExplicitTagValidation:
         assert output["tag"] is None
         assert "not found" in output["error"].lower()
 
+    def test_validated_tag_is_reported_verbatim(self, capsys):
+        """Given a tag spelled differently from its normalized Version,
+        when validating that specific tag,
+        then tag and version echo the tag as written.
+        """
+        result = run_discover_tag(
+            capsys,
+            "--pattern",
+            "dev",
+            "--validate",
+            "v1.1.22-dev2",
+            "--tag-list",
+            "v1.1.22-dev2,v1.1.23.dev1",
+        )
+
+        assert result.returncode == 0
+        output = parse_output(result)
+        assert output["tag"] == "v1.1.22-dev2"
+        assert output["version"] == "1.1.22-dev2"
+
 
 # ===========================================================================
 # Error paths
@@ -244,12 +276,13 @@ class TestExplicitTagValidation:
 class TestNoTagsExist:
     """When no matching tags exist, the script returns actionable guidance."""
 
-    def test_no_dev_tags_returns_stage_1_guidance(self):
+    def test_no_dev_tags_returns_stage_1_guidance(self, capsys):
         """Given no dev tags exist (empty tag list),
         when discovering the latest dev tag,
         then exit code is 1 and error guides user to run Stage 1 first.
         """
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "dev",
             "--tag-list",
@@ -265,12 +298,13 @@ class TestNoTagsExist:
             or "dev release" in output["error"].lower()
         )
 
-    def test_no_rc_tags_returns_stage_2_guidance(self):
+    def test_no_rc_tags_returns_stage_2_guidance(self, capsys):
         """Given no RC tags exist (empty tag list),
         when discovering the latest RC tag,
         then exit code is 1 and error guides user to run Stage 2 first.
         """
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "rc",
             "--tag-list",
@@ -290,12 +324,13 @@ class TestNoTagsExist:
 class TestInvalidInput:
     """Invalid CLI arguments produce exit code 2 with a clear error."""
 
-    def test_invalid_pattern_returns_exit_code_2(self):
+    def test_invalid_pattern_returns_exit_code_2(self, capsys):
         """Given --pattern 'stable' (not dev or rc),
         when running discover_tag.py,
         then exit code is 2 and error indicates invalid pattern.
         """
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "stable",
             "--tag-list",
@@ -308,13 +343,14 @@ class TestInvalidInput:
             "invalid" in output["error"].lower() or "pattern" in output["error"].lower()
         )
 
-    def test_invalid_tags_filtered_valid_ones_sorted(self):
+    def test_invalid_tags_filtered_valid_ones_sorted(self, capsys):
         """Given a tag list with a mix of valid and non-PEP-440 tags,
         when discovering the latest dev tag,
         then invalid tags are silently filtered and valid ones are sorted.
         """
-        tag_list = "not-a-version,v1.1.22.dev1,garbage,v1.1.23.dev1"
+        tag_list = "not-a-version,v1.1.22.dev1,garbage,v1.x.dev9,v1.1.23.dev1"
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "dev",
             "--tag-list",
@@ -326,6 +362,43 @@ class TestInvalidInput:
         assert output["found"] is True
         assert output["tag"] == "v1.1.23.dev1"
 
+    def test_unreadable_tag_file_returns_exit_code_2(self, capsys, tmp_path):
+        """Given --tag-file points to a file that does not exist,
+        when running discover_tag.py,
+        then exit code is 2 and the error names the tag file.
+        """
+        missing = tmp_path / "missing.txt"
+        result = run_discover_tag(
+            capsys,
+            "--pattern",
+            "dev",
+            "--tag-file",
+            str(missing),
+        )
+
+        assert result.returncode == 2
+        output = parse_output(result)
+        assert str(missing) in output["error"]
+
+    def test_non_utf8_tag_file_returns_exit_code_2(self, capsys, tmp_path):
+        """Given --tag-file points to a file that is not valid UTF-8,
+        when running discover_tag.py,
+        then exit code is 2 and the error names the tag file.
+        """
+        tag_file = tmp_path / "tags.txt"
+        tag_file.write_bytes(b"\xff\xfev1.1.23.dev1\n")
+        result = run_discover_tag(
+            capsys,
+            "--pattern",
+            "dev",
+            "--tag-file",
+            str(tag_file),
+        )
+
+        assert result.returncode == 2
+        output = parse_output(result)
+        assert str(tag_file) in output["error"]
+
 
 # ===========================================================================
 # Edge cases
@@ -333,12 +406,13 @@ class TestInvalidInput:
 class TestEdgeCases:
     """Boundary conditions and corner cases."""
 
-    def test_empty_tag_list_string_treated_as_no_tags(self):
+    def test_empty_tag_list_string_treated_as_no_tags(self, capsys):
         """Given --tag-list is an empty string,
         when discovering the latest dev tag,
         then it is treated as 'no matching tags' (exit 1, not a crash).
         """
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "dev",
             "--tag-list",
@@ -349,6 +423,22 @@ class TestEdgeCases:
         output = parse_output(result)
         assert output["found"] is False
 
+    def test_equal_versions_pick_same_tag_regardless_of_order(self, capsys):
+        """Given two tags that normalize to the same Version,
+        when discovering the latest dev tag with either input order,
+        then the same tag string is returned both times.
+        """
+        tags = ["1.1.23.dev1", "v1.1.23.dev1"]
+        chosen = []
+        for tag_list in (",".join(tags), ",".join(reversed(tags))):
+            result = run_discover_tag(
+                capsys, "--pattern", "dev", "--tag-list", tag_list
+            )
+            assert result.returncode == 0
+            chosen.append(parse_output(result)["tag"])
+
+        assert chosen == ["v1.1.23.dev1", "v1.1.23.dev1"]
+
 
 # ===========================================================================
 # Staleness detection (integration tests requiring a real git repo)
@@ -360,17 +450,25 @@ class TestStalenessDetection:
     to verify the commits_behind field in the JSON output.
     """
 
-    def test_tag_at_head_shows_zero_commits_behind(self, tmp_path):
+    def test_tag_at_head_shows_zero_commits_behind(
+        self, seed_repo, capsys, fresh_git_repo, monkeypatch
+    ):
         """Given a git repo where the latest dev tag points at HEAD,
         when discovering the latest dev tag (without --tag-list),
         then commits_behind is 0.
         """
-        # Set up a temp git repo with a dev tag at HEAD
-        _init_git_repo(tmp_path)
-        _create_commit(tmp_path, "initial commit")
-        _create_tag(tmp_path, "v1.1.23.dev1")
+        # Start from a copy of the session's template repo, tag at HEAD
+        seed_repo(
+            fresh_git_repo,
+            [
+                ("commit", "initial commit"),
+                ("tag", "v1.1.23.dev1"),
+            ],
+        )
 
-        result = _run_discover_in_repo(tmp_path, "--pattern", "dev")
+        result = _run_discover_in_repo(
+            capsys, monkeypatch, fresh_git_repo, "--pattern", "dev"
+        )
 
         assert result.returncode == 0
         output = parse_output(result)
@@ -378,19 +476,27 @@ class TestStalenessDetection:
         assert output["tag"] == "v1.1.23.dev1"
         assert output["commits_behind"] == 0
 
-    def test_tag_behind_head_shows_commit_count(self, tmp_path):
+    def test_tag_behind_head_shows_commit_count(
+        self, seed_repo, capsys, fresh_git_repo, monkeypatch
+    ):
         """Given a git repo where 3 commits landed after the latest dev tag,
         when discovering the latest dev tag (without --tag-list),
         then commits_behind is 3.
         """
-        _init_git_repo(tmp_path)
-        _create_commit(tmp_path, "initial commit")
-        _create_tag(tmp_path, "v1.1.23.dev1")
-        _create_commit(tmp_path, "fix: first change after tag")
-        _create_commit(tmp_path, "feat: second change after tag")
-        _create_commit(tmp_path, "docs: third change after tag")
+        seed_repo(
+            fresh_git_repo,
+            [
+                ("commit", "initial commit"),
+                ("tag", "v1.1.23.dev1"),
+                ("commit", "fix: first change after tag"),
+                ("commit", "feat: second change after tag"),
+                ("commit", "docs: third change after tag"),
+            ],
+        )
 
-        result = _run_discover_in_repo(tmp_path, "--pattern", "dev")
+        result = _run_discover_in_repo(
+            capsys, monkeypatch, fresh_git_repo, "--pattern", "dev"
+        )
 
         assert result.returncode == 0
         output = parse_output(result)
@@ -398,13 +504,16 @@ class TestStalenessDetection:
         assert output["tag"] == "v1.1.23.dev1"
         assert output["commits_behind"] == 3
 
-    def test_commits_behind_is_null_with_tag_list(self, dev_tags_mixed_versions):
+    def test_commits_behind_is_null_with_tag_list(
+        self, capsys, dev_tags_mixed_versions
+    ):
         """Given --tag-list is provided (no git context),
         when discovering the latest dev tag,
         then commits_behind is null (cannot compute without git).
         """
         tag_list = ",".join(dev_tags_mixed_versions)
         result = run_discover_tag(
+            capsys,
             "--pattern",
             "dev",
             "--tag-list",
@@ -416,46 +525,169 @@ class TestStalenessDetection:
         assert output["commits_behind"] is None
 
 
-# ---------------------------------------------------------------------------
-# Git helpers for integration tests
-# ---------------------------------------------------------------------------
-def _git(path, *command):
-    """Run a git command in the given repo directory."""
-    subprocess.run(
-        ["git", *command],
-        cwd=str(path),
-        capture_output=True,
-        check=True,
+# ===========================================================================
+# Tags read from git (integration tests requiring a real git repo)
+# ===========================================================================
+class TestGitTagListing:
+    """Without --tag-list, tags come from git and must keep their bare names."""
+
+    def test_validate_finds_tag_sharing_name_with_branch(
+        self, seed_repo, capsys, fresh_git_repo, monkeypatch
+    ):
+        """Given tag v1.2.0.dev1 and a branch also named v1.2.0.dev1,
+        when validating that tag against the repo's tags,
+        then it is found under its bare name.
+        """
+        seed_repo(
+            fresh_git_repo,
+            [
+                ("commit", "initial commit"),
+                ("tag", "v1.2.0.dev1"),
+                ("branch", "v1.2.0.dev1"),
+            ],
+        )
+
+        result = _run_discover_in_repo(
+            capsys,
+            monkeypatch,
+            fresh_git_repo,
+            "--pattern",
+            "dev",
+            "--validate",
+            "v1.2.0.dev1",
+        )
+
+        assert result.returncode == 0
+        assert parse_output(result)["tag"] == "v1.2.0.dev1"
+
+    def test_discovery_finds_tag_sharing_name_with_branch(
+        self, seed_repo, capsys, fresh_git_repo, monkeypatch
+    ):
+        """Given tag v1.2.0.dev1 and a branch also named v1.2.0.dev1,
+        when discovering the latest dev tag,
+        then that tag is returned under its bare name.
+        """
+        seed_repo(
+            fresh_git_repo,
+            [
+                ("commit", "initial commit"),
+                ("tag", "v1.2.0.dev1"),
+                ("branch", "v1.2.0.dev1"),
+            ],
+        )
+
+        result = _run_discover_in_repo(
+            capsys, monkeypatch, fresh_git_repo, "--pattern", "dev"
+        )
+
+        assert result.returncode == 0
+        output = parse_output(result)
+        assert output["tag"] == "v1.2.0.dev1"
+        assert output["commits_behind"] == 0
+
+    @pytest.mark.parametrize(
+        ("pattern", "tags", "expected"),
+        [
+            ("dev", ["v1.1.23.dev9", "v1.1.23.dev11"], "v1.1.23.dev11"),
+            ("rc", ["v1.2.0rc1", "v1.2.0rc1.dev2"], "v1.2.0rc1"),
+        ],
+        ids=["dev11-beats-dev9", "rc1-beats-rc1.dev2"],
     )
+    def test_discovery_from_git_uses_packaging_version_order(
+        self, seed_repo, capsys, fresh_git_repo, monkeypatch, pattern, tags, expected
+    ):
+        """Given several matching tags in a real repo,
+        when discovering the latest tag without --tag-list,
+        then the winner follows packaging.Version, not git's version sort.
+        """
+        seed_repo(
+            fresh_git_repo,
+            [
+                ("commit", "initial commit"),
+                *(("tag", tag) for tag in tags),
+            ],
+        )
 
+        result = _run_discover_in_repo(
+            capsys, monkeypatch, fresh_git_repo, "--pattern", pattern
+        )
 
-def _init_git_repo(path):
-    """Initialize a git repo in the given directory."""
-    _git(path, "init")
-    _git(path, "config", "user.email", "test@example.com")
-    _git(path, "config", "user.name", "Test")
+        assert result.returncode == 0
+        assert parse_output(result)["tag"] == expected
+
+    @pytest.mark.parametrize(
+        ("pattern", "tags", "expected"),
+        [
+            ("dev", ["v1.1.0.dev1", "v1.2.0.DEV3"], "v1.2.0.DEV3"),
+            ("rc", ["v1.1.0rc1", "v1.2.0c1"], "v1.2.0c1"),
+            ("rc", ["v1.1.0rc1", "v1.2.0pre1"], "v1.2.0pre1"),
+        ],
+        ids=["uppercase-dev", "c-spelling", "pre-spelling"],
+    )
+    def test_discovery_from_git_finds_non_canonical_spellings(
+        self, seed_repo, capsys, fresh_git_repo, monkeypatch, pattern, tags, expected
+    ):
+        """Given a repo whose newest pre-release tag uses a spelling packaging
+        normalizes (c/pre for rc, uppercase DEV),
+        when discovering the latest tag without --tag-list,
+        then git's pre-filter does not hide it.
+        """
+        seed_repo(
+            fresh_git_repo,
+            [
+                ("commit", "initial commit"),
+                *(("tag", tag) for tag in tags),
+            ],
+        )
 
+        result = _run_discover_in_repo(
+            capsys, monkeypatch, fresh_git_repo, "--pattern", pattern
+        )
+
+        assert result.returncode == 0
+        assert parse_output(result)["tag"] == expected
 
-def _create_commit(path, message):
-    """Create an empty commit in the given git repo."""
-    _git(path, "commit", "--allow-empty", "-m", message)
 
+# ===========================================================================
+# CLI contract (subprocess smoke test)
+# ===========================================================================
+class TestCliContract:
+    """The script still works when executed directly by path, as CI does."""
 
-def _create_tag(path, tag_name):
-    """Create a lightweight tag at HEAD in the given git repo."""
-    _git(path, "tag", tag_name)
+    def test_script_runs_standalone_in_git_repo(self, seed_repo, fresh_git_repo):
+        """Given a git repo with a dev tag at HEAD,
+        when running discover_tag.py as a subprocess,
+        then it prints the JSON result and exits 0.
+        """
+        seed_repo(
+            fresh_git_repo,
+            [
+                ("commit", "initial commit"),
+                ("tag", "v1.1.23.dev1"),
+            ],
+        )
 
+        result = _run_discover_cli(fresh_git_repo, "--pattern", "dev")
 
-def _project_root():
-    """Resolve project root from this test file's location."""
-    return str(Path(__file__).resolve().parents[2])
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        output = parse_output(result)
+        assert output["tag"] == "v1.1.23.dev1"
+        assert output["commits_behind"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Git helpers for integration tests
+# ---------------------------------------------------------------------------
+def _run_discover_in_repo(capsys, monkeypatch, repo_path, *args):
+    """Run discover_tag.main() in-process with a git repo as the working directory."""
+    monkeypatch.chdir(repo_path)
+    return run_discover_tag(capsys, *args)
 
 
-def _run_discover_in_repo(repo_path, *args):
-    """Run discover_tag.py inside a specific git repo directory."""
-    script_path = str(Path(_project_root()) / SCRIPT)
+def _run_discover_cli(repo_path, *args):
+    """Run discover_tag.py as a subprocess inside a specific git repo directory."""
     return subprocess.run(
-        [sys.executable, script_path, *args],
+        [*_DISCOVER_CMD, *args],
         cwd=str(repo_path),
         capture_output=True,
         text=True,
@@ -1,8 +1,9 @@
 """Tests for scripts/release/read_toml_field.py
 
 Extracts inline TOML field-reading logic from release-prod.yml into a testable
-standalone script.  Tests run the script via subprocess to validate the
-real CLI contract.
+standalone script.  Tests call the script's main() in-process, capturing
+stdout/stderr and the exit code; a single subprocess smoke test guards the
+real ``python -m`` CLI contract.
 
 BDD scenario mapping:
   - release-prod.yml "Save current nwave-ai version" (P7: project.version)
@@ -14,12 +15,44 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from typing import TYPE_CHECKING
 
+import pytest
 
-def _run_read_toml(args: list[str]) -> subprocess.CompletedProcess:
+from scripts.release import read_toml_field as _rtf
+from tests.release.conftest import run_main
+
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+
+_READ_TOML_CMD = (sys.executable, "-m", "scripts.release.read_toml_field")
+
+
+_PYPROJECT_TOML = (
+    '[project]\nname = "test"\nversion = "1.2.3"\n\n'
+    '[tool.nwave]\npublic_version = "1.1.0"\n'
+)
+
+
+@pytest.fixture(scope="class")
+def pyproject_toml(tmp_path_factory) -> str:
+    """A read-only pyproject.toml written once per test class."""
+    path = tmp_path_factory.mktemp("toml") / "pyproject.toml"
+    path.write_text(_PYPROJECT_TOML)
+    return str(path)
+
+
+def _run_read_toml(capsys, args: list[str]) -> SimpleNamespace:
+    """Run read_toml_field.main() in-process and return a CompletedProcess-like result."""
+    return run_main(capsys, _rtf.main, args)
+
+
+def _run_read_toml_cli(args: list[str]) -> subprocess.CompletedProcess:
     """Run read_toml_field.py as a subprocess and return the result."""
     return subprocess.run(
-        [sys.executable, "-m", "scripts.release.read_toml_field", *args],
+        [*_READ_TOML_CMD, *args],
         capture_output=True,
         text=True,
     )
@@ -33,45 +66,89 @@ def _run_read_toml(args: list[str]) -> subprocess.CompletedProcess:
 class TestReadProjectVersion:
     """Reading version from the [project] table."""
 
-    def test_reads_project_version(self, tmp_path):
+    def test_reads_project_version(self, capsys, pyproject_toml):
         """Given a pyproject.toml with [project] version = '1.2.3',
         when reading --key project.version,
         then stdout is '1.2.3'."""
-        toml_content = '[project]\nname = "test"\nversion = "1.2.3"\n'
-        (tmp_path / "pyproject.toml").write_text(toml_content)
-
         result = _run_read_toml(
+            capsys,
             [
                 "--file",
-                str(tmp_path / "pyproject.toml"),
+                pyproject_toml,
                 "--key",
                 "project.version",
-            ]
+            ],
         )
 
         assert result.returncode == 0
         assert result.stdout.strip() == "1.2.3"
 
-    def test_reads_nested_tool_field(self, tmp_path):
+    def test_reads_nested_tool_field(self, capsys, pyproject_toml):
         """Given a pyproject.toml with [tool.nwave] public_version = '1.1.0',
         when reading --key tool.nwave.public_version,
         then stdout is '1.1.0'."""
-        toml_content = '[project]\nname = "test"\nversion = "1.2.3"\n\n[tool.nwave]\npublic_version = "1.1.0"\n'
-        (tmp_path / "pyproject.toml").write_text(toml_content)
-
         result = _run_read_toml(
+            capsys,
             [
                 "--file",
-                str(tmp_path / "pyproject.toml"),
+                pyproject_toml,
                 "--key",
                 "tool.nwave.public_version",
-            ]
+            ],
         )
 
         assert result.returncode == 0
         assert result.stdout.strip() == "1.1.0"
 
 
+# ---------------------------------------------------------------------------
+# Reading several fields in one invocation
+# ---------------------------------------------------------------------------
+
+
+class TestMultipleKeys:
+    """Repeated --key flags resolve several fields from a single parse."""
+
+    def test_prints_values_in_key_order(self, capsys, pyproject_toml):
+        """Given --key project.version --key tool.nwave.public_version,
+        then stdout has one value per line in the order requested."""
+        result = _run_read_toml(
+            capsys,
+            [
+                "--file",
+                pyproject_toml,
+                "--key",
+                "tool.nwave.public_version",
+                "--key",
+                "project.version",
+            ],
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.splitlines() == ["1.1.0", "1.2.3"]
+
+    def test_any_missing_key_exits_with_error_and_prints_nothing(
+        self, capsys, pyproject_toml
+    ):
+        """Given one valid and one missing --key,
+        then exit code is 1 and no partial values reach stdout."""
+        result = _run_read_toml(
+            capsys,
+            [
+                "--file",
+                pyproject_toml,
+                "--key",
+                "project.version",
+                "--key",
+                "project.nonexistent",
+            ],
+        )
+
+        assert result.returncode == 1
+        assert result.stdout == ""
+        assert "project.nonexistent" in result.stderr
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
@@ -80,52 +157,49 @@ class TestReadProjectVersion:
 class TestErrorHandling:
     """Error paths for missing files and keys."""
 
-    def test_missing_file_exits_with_error(self, tmp_path):
+    def test_missing_file_exits_with_error(self, capsys, tmp_path):
         """Given --file points to nonexistent file,
         then exit code is 1."""
         result = _run_read_toml(
+            capsys,
             [
                 "--file",
                 str(tmp_path / "nonexistent.toml"),
                 "--key",
                 "project.version",
-            ]
+            ],
         )
 
         assert result.returncode == 1
         assert result.stderr.strip() != ""
 
-    def test_missing_key_exits_with_error(self, tmp_path):
+    def test_missing_key_exits_with_error(self, capsys, pyproject_toml):
         """Given --key points to nonexistent field,
         then exit code is 1."""
-        toml_content = '[project]\nname = "test"\nversion = "1.2.3"\n'
-        (tmp_path / "pyproject.toml").write_text(toml_content)
-
         result = _run_read_toml(
+            capsys,
             [
                 "--file",
-                str(tmp_path / "pyproject.toml"),
+                pyproject_toml,
                 "--key",
                 "project.nonexistent",
-            ]
+            ],
         )
 
         assert result.returncode == 1
         assert result.stderr.strip() != ""
 
-    def test_partial_key_path_exits_with_error(self, tmp_path):
+    def test_partial_key_path_exits_with_error(self, capsys, pyproject_toml):
         """Given --key 'project.nonexistent.deep',
         then exit code is 1."""
-        toml_content = '[project]\nname = "test"\nversion = "1.2.3"\n'
-        (tmp_path / "pyproject.toml").write_text(toml_content)
-
         result = _run_read_toml(
+            capsys,
             [
                 "--file",
-                str(tmp_path / "pyproject.toml"),
+                pyproject_toml,
                 "--key",
                 "project.nonexistent.deep",
-            ]
+            ],
         )
 
         assert result.returncode == 1
@@ -140,7 +214,7 @@ class TestErrorHandling:
 class TestEdgeCases:
     """Edge cases for TOML field reading."""
 
-    def test_reads_integer_field(self, tmp_path):
+    def test_reads_integer_field(self, capsys, tmp_path):
         """Given a TOML with count = 42,
         when reading that field,
         then stdout is '42'."""
@@ -148,18 +222,19 @@ class TestEdgeCases:
         (tmp_path / "data.toml").write_text(toml_content)
 
         result = _run_read_toml(
+            capsys,
             [
                 "--file",
                 str(tmp_path / "data.toml"),
                 "--key",
                 "count",
-            ]
+            ],
         )
 
         assert result.returncode == 0
         assert result.stdout.strip() == "42"
 
-    def test_reads_top_level_field(self, tmp_path):
+    def test_reads_top_level_field(self, capsys, tmp_path):
         """Given a TOML with name = 'foo' at top level,
         when reading --key name,
         then stdout is 'foo'."""
@@ -167,13 +242,34 @@ class TestEdgeCases:
         (tmp_path / "data.toml").write_text(toml_content)
 
         result = _run_read_toml(
+            capsys,
             [
                 "--file",
                 str(tmp_path / "data.toml"),
                 "--key",
                 "name",
-            ]
+            ],
         )
 
         assert result.returncode == 0
         assert result.stdout.strip() == "foo"
+
+
+# ---------------------------------------------------------------------------
+# CLI contract
+# ---------------------------------------------------------------------------
+
+
+class TestCliContract:
+    """The script still works as ``python -m scripts.release.read_toml_field``."""
+
+    def test_module_invocation_prints_value(self, pyproject_toml):
+        """Given a real subprocess invocation,
+        when reading --key project.version,
+        then it exits 0 and prints the value on stdout."""
+        result = _run_read_toml_cli(
+            ["--file", pyproject_toml, "--key", "project.version"]
+        )
+
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        assert result.stdout.strip() == "1.2.3"